@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from .tokenization_nltk import NlktTokenizer
 
@@ -94,6 +96,103 @@ class NltkTokenizationTests(unittest.TestCase):
         self.tokenizer.add_tokens([special_token])
         tokens = self.tokenizer.tokenize("This is a test " + special_token)
         self.assertIn(special_token, tokens)
+
+    def test_change_eos_token(self):
+        """
+        Test tokenization after assigning a new EOS token.
+
+        Ensures that the new EOS token is kept whole and not added twice, and that cached results are dropped.
+        """
+        self.assertEqual(self.tokenizer.tokenize("</s>Hello"), ["<", "/s", ">", "Hello"])
+        self.tokenizer.eos_token = "</s>"
+        tokens = self.tokenizer.tokenize("</s>Hello", add_special_tokens=True)
+        self.assertEqual(tokens, ["</s>", "Hello", "<end_of_text>"])
+        self.assertEqual(self.tokenizer.tokenize("<s>Hello"), ["<", "s", ">", "Hello"])
+
+    def test_add_custom_tokens(self):
+        """
+        Test that tokens added to the tokenizer are kept whole during tokenization.
+
+        Ensures that added tokens which NLTK would otherwise split are returned as a single token.
+        """
+        self.tokenizer.add_tokens(["<sep>", "[NEW-TOKEN]"])
+        tokens = self.tokenizer.tokenize("Hello<sep>world [NEW-TOKEN].")
+        self.assertEqual(tokens, ["Hello", "<sep>", "world", "[NEW-TOKEN]", "."])
+
+        # Nothing to add: the special tokens and the tokens of other texts are left unchanged
+        self.assertEqual(self.tokenizer.add_tokens(None), 0)
+        self.assertEqual(self.tokenizer.add_tokens([]), 0)
+        self.assertEqual(self.tokenizer.tokenize("Nonetheless"), ["Nonetheless"])
+
+    def test_tokenize_stream(self):
+        """
+        Test tokenization of a text streamed in small pieces.
+
+        Ensures that cutting the text into chunks doesn't split or merge tokens at the chunk boundaries.
+        """
+        text = "This is a longer text, it includes multiple words and various other elements <s> here"
+        pieces = [text[i:i + 7] for i in range(0, len(text), 7)]
+        tokens = list(self.tokenizer.tokenize_stream(pieces, chunk_size=16))
+        self.assertEqual(tokens, self.tokenizer.tokenize(text))
+
+    def test_regex_tokenize(self):
+        """
+        Test tokenization with the compiled regex instead of NLTK's word_tokenize.
+
+        Ensures that words, punctuation and special tokens are split as with NLTK for simple texts.
+        """
+        tokenizer = NlktTokenizer(vocab_file='vocab.txt', regex_tokenize=True)
+        for text in ["Hello, world! #tokenizer", "Tokenizer Test: Mixed CASE.", "Привет, как дела? Café."]:
+            self.assertEqual(tokenizer.tokenize(text), self.tokenizer.tokenize(text))
+        tokens = tokenizer.tokenize("<s>Hello, world!<end_of_text>")
+        self.assertEqual(tokens, ['<s>', 'Hello', ',', 'world', '!', '<end_of_text>'])
+
+    def test_repeated_tokenization(self):
+        """
+        Test tokenizing the same text several times.
+
+        Ensures that cached tokens are returned unchanged even after a previous result was modified,
+        and that long texts are not cached.
+        """
+        tokens = self.tokenizer.tokenize("Hello, world!", add_special_tokens=True)
+        self.assertEqual(tokens, ["<s>", "Hello", ",", "world", "!", "<end_of_text>"])
+        self.assertEqual(self.tokenizer.tokenize("Hello, world!"), ["Hello", ",", "world", "!"])
+
+        # Long texts are tokenized without being kept in the cache
+        long_text = "This is a longer text. " * 100
+        self.assertEqual(self.tokenizer.tokenize(long_text), self.tokenizer.tokenize(long_text))
+        self.assertNotIn(long_text, self.tokenizer._tok_cache)
+
+    def test_tokenize_batch(self):
+        """
+        Test tokenization of a batch of texts.
+
+        Ensures that tokenize_batch returns the same tokens as tokenizing every text on its own.
+        """
+        texts = ["This is a test", "<s>Hello, world!<end_of_text>", ""]
+        batch_tokens = self.tokenizer.tokenize_batch(texts, add_special_tokens=True)
+        expected_tokens = [self.tokenizer.tokenize(text, add_special_tokens=True) for text in texts]
+        self.assertEqual(batch_tokens, expected_tokens)
+
+    def test_tokenize_parallel(self):
+        """
+        Test tokenization of a batch of texts across worker processes.
+
+        Ensures that tokenize_parallel keeps the order of the texts, matches tokenize_batch and reuses its workers.
+        """
+        texts = ["This is a test", "Hello, world! #tokenizer", "Testing 123, is it working?"] * 4
+        with self.tokenizer:
+            tokens = self.tokenizer.tokenize_parallel(texts, n_jobs=2)
+            self.assertEqual(tokens, self.tokenizer.tokenize_batch(texts))
+
+            # The workers are reused, and replaced once the special tokens change
+            pool = self.tokenizer._pool
+            self.tokenizer.tokenize_parallel(texts, n_jobs=2)
+            self.assertIs(self.tokenizer._pool, pool)
+            self.tokenizer.add_tokens(["<sep>"])
+            tokens = self.tokenizer.tokenize_parallel(["a<sep>b", "c"], n_jobs=2)
+            self.assertEqual(tokens, [["a", "<sep>", "b"], ["c"]])
+        self.assertIsNone(self.tokenizer._pool)
         
    
     def test_convert_token_to_id(self):
@@ -121,7 +220,7 @@ class NltkTokenizationTests(unittest.TestCase):
         Verifies that the method correctly returns the token for a given ID.
         """
         token_id = 5  # Assuming '5' is a valid ID in your vocabulary
-        expected_token = self.tokenizer.id_to_token.get(token_id - 1)  # Adjusting for zero-based indexing
+        expected_token = self.tokenizer.id_to_token[token_id - 1]  # Adjusting for zero-based indexing
         token = self.tokenizer._convert_id_to_token(token_id)
         self.assertEqual(token, expected_token, f"Token for ID {token_id} should be '{expected_token}', got '{token}'")
 
@@ -129,3 +228,53 @@ class NltkTokenizationTests(unittest.TestCase):
         unknown_id = 99999  # Assuming this ID does not exist in your vocabulary
         unknown_token = self.tokenizer._convert_id_to_token(unknown_id)
         self.assertEqual(unknown_token, "[UNK]", f"Token for unknown ID should be '[UNK]', got '{unknown_token}'")
+
+    def test_convert_tokens_to_ids_batch(self):
+        """
+        Test the conversion of a sequence of tokens to IDs and back.
+
+        Ensures that the batched conversions match converting every token or ID on its own.
+        """
+        tokens = ["the", "weather", "unknown_token", "!"]
+        token_ids = self.tokenizer.convert_tokens_to_ids(tokens)
+        self.assertEqual(token_ids, [self.tokenizer._convert_token_to_id(token) for token in tokens])
+
+        ids = [1, 24707, 4634, 1000, 99999]
+        converted_tokens = self.tokenizer.convert_ids_to_tokens(ids)
+        self.assertEqual(converted_tokens, [self.tokenizer._convert_id_to_token(i) for i in ids])
+
+    def test_encode_ids(self):
+        """
+        Test encoding a text straight to token IDs.
+
+        Ensures that encode_ids matches tokenizing the text and converting the tokens to IDs.
+        """
+        text = "<s>The weather is sunny, isn't it?<end_of_text>"
+        regex_tokenizer = NlktTokenizer(vocab_file='vocab.txt', regex_tokenize=True)
+        for tokenizer in (self.tokenizer, regex_tokenizer):
+            expected_ids = tokenizer.convert_tokens_to_ids(tokenizer.tokenize(text))
+            self.assertEqual(tokenizer.encode_ids(text), expected_ids)
+
+    def test_get_vocab(self):
+        """
+        Test retrieving the vocabulary.
+
+        Ensures that get_vocab maps every token of the vocabulary file to its zero-based index.
+        """
+        vocab = self.tokenizer.get_vocab()
+        self.assertEqual(len(vocab), len(self.tokenizer.vocab))
+        self.assertEqual(vocab["[UNK]"], self.tokenizer.vocab["[UNK]"])
+        self.assertEqual(vocab["test"], self.tokenizer.vocab["test"])
+
+    def test_save_vocabulary(self):
+        """
+        Test saving the vocabulary and loading it back.
+
+        Ensures that a tokenizer loaded from the saved vocabulary file has the same token IDs.
+        """
+        with tempfile.TemporaryDirectory() as save_directory:
+            (vocab_file,) = self.tokenizer.save_vocabulary(save_directory)
+            self.assertEqual(vocab_file, os.path.join(save_directory, "vocab.txt"))
+            loaded_tokenizer = NlktTokenizer(vocab_file=vocab_file)
+        self.assertEqual(loaded_tokenizer.vocab, self.tokenizer.vocab)
+        self.assertEqual(loaded_tokenizer.id_to_token, self.tokenizer.id_to_token)
@@ -3,11 +3,129 @@
 # the goal id to leverage the 'PreTrainedTokenizer' class from 
 # the Transformers library to create a NLTK-based tokenizer.
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+from functools import partial
 from transformers import PreTrainedTokenizer
 import nltk
-from nltk.tokenize import word_tokenize
+from nltk.tokenize import NLTKWordTokenizer
+import multiprocessing
 import os
+import re
+import sys
+
+# Word-or-punctuation pattern used instead of word_tokenize when regex_tokenize is set
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+# The same pattern for ASCII-only text, where \w and \s skip the Unicode tables. Unicode
+# \s also matches \x1c-\x1f but ASCII \s doesn't, so they are excluded explicitly.
+_ASCII_TOKEN_RE = re.compile(r"\w+|[^\w\s\x1c-\x1f]", re.ASCII)
+
+# Maximum number of texts whose tokens each tokenizer keeps cached
+_TOKENIZE_CACHE_SIZE = 4096
+# Only texts up to this many characters (prompts, prefixes...) are cached: longer ones
+# are unlikely to repeat and would pin whole documents in the cache
+_TOKENIZE_CACHE_MAX_LENGTH = 1024
+
+
+def _ensure_punkt(resource='punkt'):
+    """
+    Makes sure the NLTK punkt models are available, downloading them only when
+    they cannot be found locally.
+    """
+    try:
+        nltk.data.find(f'tokenizers/{resource}')
+    except LookupError:
+        nltk.download(resource, quiet=True)
+
+
+def _load_punkt():
+    """
+    Loads the English punkt sentence tokenizer that word_tokenize uses.
+    """
+    try:
+        from nltk.tokenize.punkt import PunktTokenizer
+    except ImportError:
+        # NLTK < 3.8.2 ships the punkt models as a pickle
+        _ensure_punkt('punkt')
+        return nltk.data.load('tokenizers/punkt/english.pickle')
+    _ensure_punkt('punkt_tab')
+    return PunktTokenizer('english')
+
+
+# Tokenizer owned by a tokenize_parallel worker process, set once by _init_worker
+_worker_tokenizer = None
+
+
+def _init_worker(tokenizer):
+    """
+    Initializes a tokenize_parallel worker: loads punkt once and keeps the tokenizer
+    around for every text the worker handles.
+    """
+    global _worker_tokenizer
+    if not tokenizer.regex_tokenize:
+        tokenizer._load_nltk_tokenizers()
+    _worker_tokenizer = tokenizer
+
+
+def _tokenize_in_worker(text, add_special_tokens=False):
+    """
+    Tokenizes a single text with the tokenizer of the current worker process.
+    """
+    return _worker_tokenizer.tokenize(text, add_special_tokens=add_special_tokens)
+
+
+def _compile_special_tokens(special_tokens):
+    """
+    Builds a single regex matching any of the given special tokens, along with the
+    placeholders they are swapped for while NLTK tokenizes the text.
+
+    Args:
+        special_tokens (Iterable[str]): 
+            The special tokens to protect from NLTK's tokenization.
+    Returns:
+        Tuple[Optional[re.Pattern], Dict[str, str], Dict[str, str]]: 
+            The compiled pattern (None if there are no special tokens), the
+            token -> placeholder map and the placeholder -> token map.
+    """
+    to_placeholder = {}
+    for token in special_tokens:
+        if token and token not in to_placeholder:
+            to_placeholder[token] = f" __SPECIAL{len(to_placeholder)}__ "
+    from_placeholder = {placeholder.strip(): token for token, placeholder in to_placeholder.items()}
+    if not to_placeholder:
+        return None, to_placeholder, from_placeholder
+
+    # Longest tokens first so a special token can't shadow another one it prefixes
+    alternatives = sorted(to_placeholder, key=len, reverse=True)
+    pattern = re.compile("|".join(map(re.escape, alternatives)))
+    return pattern, to_placeholder, from_placeholder
+
+
+def _compile_token_pattern(special_tokens):
+    """
+    Fuses the special tokens into the regex_tokenize pattern, so that a single regex scan
+    both keeps the special tokens whole and splits the rest into words and punctuation.
+
+    Args:
+        special_tokens (Iterable[str]): 
+            The special tokens to keep whole.
+    Returns:
+        Tuple[re.Pattern, re.Pattern]: 
+            The compiled pattern, to be used with findall, and the same pattern 
+            specialized for ASCII-only text.
+    """
+    special_tokens = sorted(special_tokens, key=len, reverse=True)
+    if not special_tokens:
+        return _TOKEN_RE, _ASCII_TOKEN_RE
+
+    specials = "|".join(map(re.escape, special_tokens))
+    word = r"\w+"
+    if any(re.match(r"\w", token) for token in special_tokens):
+        # A special token may start inside a run of word characters: end the word there
+        word = r"(?:(?!%s)\w)+" % specials
+    pattern = re.compile(r"%s|%s|[^\w\s]" % (specials, word))
+    ascii_pattern = re.compile(r"%s|%s|[^\w\s\x1c-\x1f]" % (specials, word), re.ASCII)
+    return pattern, ascii_pattern
+
 
 class NlktTokenizer(PreTrainedTokenizer):
 
@@ -49,18 +167,111 @@ class NlktTokenizer(PreTrainedTokenizer):
             File path to the tokenizer's vocabulary.
         eos_token (str, optional): 
             Token to denote the end of a sentence. Defaults to "<s>".
+        regex_tokenize (bool, optional): 
+            Split text into runs of word characters and single punctuation marks with one
+            compiled regex instead of NLTK's word_tokenize. Much faster, but contractions,
+            hyphenated words and decimals are split further ("hobbit-hole" -> 'hobbit', 
+            '-', 'hole') and quotes are kept as is. Defaults to False.
         **kwargs: 
             Additional keyword arguments for the tokenizer.
     """
+
+    # NLTK tokenizers behind word_tokenize, loaded once and shared by every instance so
+    # that _tokenize skips word_tokenize's per-call model lookup.
+    _sent_tokenizer = None
+    _word_tokenizer = None
     
-    def __init__(self, vocab_file='vocab.txt', eos_token="<s>", **kwargs):
+    def __init__(self, vocab_file='vocab.txt', eos_token="<s>", regex_tokenize=False, **kwargs):
         """
         Initialize the NlktTokenizer with a vocabulary file and an optional EOS token.
         """
-        super().__init__(eos_token=eos_token, **kwargs)
+        super().__init__(eos_token=eos_token, regex_tokenize=regex_tokenize, **kwargs)
+        self.regex_tokenize = regex_tokenize
+        if not regex_tokenize:
+            self._load_nltk_tokenizers()
+        # IDs are dense (the line numbers), so id -> token is a plain list. Tokens are
+        # interned so the list and the vocab dict share the same string objects.
+        # Only the line ending is stripped so tokens with leading/trailing spaces are kept.
         with open(vocab_file, 'r', encoding='utf-8') as f:
-            self.vocab = {line.strip(): idx for idx, line in enumerate(f.readlines())}
-        self.id_to_token = {id: token for token, id in self.vocab.items()}
+            self.id_to_token = [sys.intern(line.rstrip('\r\n')) for line in f]
+        self.vocab = {token: idx for idx, token in enumerate(self.id_to_token)}
+        self._unk_id = self.vocab.get("[UNK]")
+        # Tokens registered through add_tokens, kept whole by _tokenize along with the
+        # current EOS token and <end_of_text>
+        self._added_special_tokens: Tuple[str, ...] = ()
+        # Worker processes of tokenize_parallel, started on its first call
+        self._pool = None
+        self._pool_jobs = None
+        self._update_special_tokens()
+
+    @property
+    def eos_token(self) -> str:
+        """
+        `str`: End of sentence token, kept whole during tokenization.
+        """
+        return PreTrainedTokenizer.eos_token.fget(self)
+
+    @eos_token.setter
+    def eos_token(self, value):
+        PreTrainedTokenizer.eos_token.fset(self, value)
+        # The compiled special tokens protect the current EOS token, so recompile them
+        # (PreTrainedTokenizer.__init__ sets it before they exist)
+        if hasattr(self, '_added_special_tokens'):
+            self._update_special_tokens()
+
+    @classmethod
+    def _load_nltk_tokenizers(cls):
+
+        """
+        Loads the punkt sentence tokenizer and NLTK's word tokenizer, unless already loaded.
+        """
+        if cls._sent_tokenizer is None:
+            cls._sent_tokenizer = _load_punkt()
+            cls._word_tokenizer = NLTKWordTokenizer()
+
+    def _update_special_tokens(self):
+
+        """
+        Compiles the special tokens into the regex and placeholder maps used by _tokenize.
+        Only called on init, when eos_token is set and from add_tokens, so tokenizing 
+        never rebuilds them.
+        """
+        self._all_special_tokens = (self.eos_token, "<end_of_text>") + self._added_special_tokens
+        special = _compile_special_tokens(self._all_special_tokens)
+        self._special_pattern, self._placeholder_for, self._placeholder_map = special
+        self._token_pattern, self._ascii_token_pattern = _compile_token_pattern(self._placeholder_for)
+        # Cached tokens depend on the special tokens, so drop them all
+        self._tok_cache: Dict[str, Tuple[str, ...]] = {}
+        # The workers of tokenize_parallel hold a copy with the old special tokens
+        self.close()
+
+    def add_tokens(self, new_tokens, special_tokens: bool = False) -> int:
+
+        """
+        Adds tokens to the tokenizer (see PreTrainedTokenizer.add_tokens) and registers them
+        as special tokens that _tokenize keeps whole.
+
+        Args:
+            new_tokens (Union[str, List[str]]): 
+                Token(s) to add to the tokenizer.
+            special_tokens (bool, optional): 
+                Whether the tokens should be added as special tokens. Defaults to False.
+        Returns:
+            int: 
+                Number of tokens added to the vocabulary.
+        """
+        if not new_tokens:
+            return 0
+
+        num_added = super().add_tokens(new_tokens, special_tokens=special_tokens)
+        if not isinstance(new_tokens, (list, tuple)):
+            new_tokens = [new_tokens]
+        registered = tuple(dict.fromkeys(token for token in map(str, new_tokens)
+                                         if token not in self._added_special_tokens))
+        if registered:
+            self._added_special_tokens += registered
+            self._update_special_tokens()
+        return num_added
 
     def _tokenize(self, text, **kwargs):
         
@@ -75,21 +286,104 @@ class NlktTokenizer(PreTrainedTokenizer):
                 List of tokens including special tokens.
         """
         
-        nltk.download('punkt', quiet=True)
-        special_tokens = [self.eos_token, "<end_of_text>"]
-        temp_replacements = {}
-
-        # Update to ensure special tokens are surrounded by spaces for proper separation
-        for idx, token in enumerate(special_tokens):
-            placeholder = f" __SPECIAL{idx}__ "
-            if token in text:
-                text = text.replace(token, placeholder)
-                temp_replacements[placeholder.strip()] = token
-
-        tokens = word_tokenize(text)
-        reverted_tokens = [temp_replacements.get(token, token) for token in tokens]
+        if len(text) > _TOKENIZE_CACHE_MAX_LENGTH:
+            return self._tokenize_uncached(text)
+        # Hand out a fresh list so callers (e.g. tokenize) can't mutate the cache
+        return list(self._tokenize_frozen(text))
+
+    def _tokenize_frozen(self, text):
+
+        """
+        Cached tokenization: returns the tokens as an immutable tuple, shared with the
+        tokenizer's cache, so callers that only read the tokens avoid any copy. Texts
+        longer than _TOKENIZE_CACHE_MAX_LENGTH are tokenized without being cached.
+
+        Args:
+            text (str): 
+                The input text to tokenize.
+        Returns:
+            Tuple[str, ...]: 
+                Tuple of tokens including special tokens.
+        """
+        if len(text) > _TOKENIZE_CACHE_MAX_LENGTH:
+            return tuple(self._tokenize_uncached(text))
+
+        tokens = self._tok_cache.get(text)
+        if tokens is None:
+            tokens = tuple(self._tokenize_uncached(text))
+            if len(self._tok_cache) >= _TOKENIZE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._tok_cache[next(iter(self._tok_cache))]
+            self._tok_cache[text] = tokens
+        return tokens
+
+    def _tokenize_uncached(self, text):
+
+        """
+        Tokenizes the text with NLTK (or the compiled regex when regex_tokenize is set),
+        protecting the special tokens from being split.
+
+        Args:
+            text (str): 
+                The input text to tokenize.
+        Returns:
+            List[str]: 
+                List of tokens including special tokens.
+        """
+
+        # Special tokens are part of the pattern itself: one scan, no placeholders
+        if self.regex_tokenize:
+            return self._regex_tokenize(text)
+
+        # No special tokens in the text (the common case): hand it straight to NLTK,
+        # skipping the placeholder substitution and the map back over the tokens
+        if self._special_pattern is None or self._special_pattern.search(text) is None:
+            return self._nltk_tokenize(text)
+
+        # Surround special tokens with spaces (via their placeholder) for proper separation
+        placeholder_for = self._placeholder_for
+        text = self._special_pattern.sub(lambda match: placeholder_for[match.group(0)], text)
+
+        tokens = self._nltk_tokenize(text)
+        # Most tokens aren't placeholders: a bare membership test is cheaper for them than a
+        # dict.get call. Texts without any placeholder already returned above.
+        placeholder_map = self._placeholder_map
+        reverted_tokens = [placeholder_map[token] if token in placeholder_map else token for token in tokens]
         return reverted_tokens
 
+    def _nltk_tokenize(self, text):
+
+        """
+        Same as NLTK's word_tokenize (punkt sentence splitting, then NLTK's improved 
+        Treebank word tokenizer on every sentence), using the shared tokenizer instances.
+
+        Args:
+            text (str): 
+                The input text to tokenize.
+        Returns:
+            List[str]: 
+                List of tokens.
+        """
+        word_tokenizer = self._word_tokenizer
+        return [token for sentence in self._sent_tokenizer.tokenize(text)
+                for token in word_tokenizer.tokenize(sentence)]
+
+    def _regex_tokenize(self, text):
+
+        """
+        Splits the text with the token regex of regex_tokenize, using its ASCII-specialized
+        variant when the text is pure ASCII (the common case).
+
+        Args:
+            text (str): 
+                The input text to tokenize.
+        Returns:
+            List[str]: 
+                List of tokens including special tokens.
+        """
+        pattern = self._ascii_token_pattern if text.isascii() else self._token_pattern
+        return pattern.findall(text)
+
     def tokenize(self, text, add_special_tokens=False, **kwargs) -> List[str]:
         
         """
@@ -109,11 +403,140 @@ class NlktTokenizer(PreTrainedTokenizer):
 
         tokens = self._tokenize(text, **kwargs)
         if add_special_tokens:
-            if self.eos_token not in tokens:
-                tokens.insert(0, self.eos_token)
-            if "<end_of_text>" not in tokens:
-                tokens.append("<end_of_text>")
+            self._wrap_with_special_tokens(tokens)
         return tokens
+
+    def tokenize_batch(self, texts, add_special_tokens=False, **kwargs) -> List[List[str]]:
+
+        """
+        Tokenizes a batch of texts, amortizing the per-call overhead of tokenize.
+
+        Args:
+            texts (List[str]): 
+                The texts to tokenize.
+            add_special_tokens (bool, optional): 
+                Whether to add special tokens. Defaults to False.
+            **kwargs: 
+                Additional keyword arguments.
+        Returns:
+            List[List[str]]: The list of tokens of every text, in order.
+        """
+
+        batch_tokens = []
+        for text in texts:
+            tokens = self._tokenize(text, **kwargs)
+            if add_special_tokens:
+                self._wrap_with_special_tokens(tokens)
+            batch_tokens.append(tokens)
+        return batch_tokens
+
+    def tokenize_parallel(self, texts, n_jobs: Optional[int] = None, add_special_tokens=False) -> List[List[str]]:
+
+        """
+        Tokenizes a batch of texts across a pool of worker processes. The pool is created
+        on the first call and reused by later calls with the same n_jobs: every worker 
+        loads punkt and receives the tokenizer once, then tokenizes its share of the texts.
+        Shut the workers down with close(), or use the tokenizer as a context manager.
+
+        Args:
+            texts (List[str]): 
+                The texts to tokenize.
+            n_jobs (int, optional): 
+                Number of worker processes. Defaults to the number of CPUs.
+            add_special_tokens (bool, optional): 
+                Whether to add special tokens. Defaults to False.
+        Returns:
+            List[List[str]]: The list of tokens of every text, in order.
+        """
+
+        texts = list(texts)
+        n_jobs = n_jobs or os.cpu_count() or 1
+        if n_jobs == 1 or len(texts) < 2:
+            return self.tokenize_batch(texts, add_special_tokens=add_special_tokens)
+
+        if self._pool is None or self._pool_jobs != n_jobs:
+            self.close()
+            self._pool = multiprocessing.Pool(n_jobs, initializer=_init_worker, initargs=(self,))
+            self._pool_jobs = n_jobs
+
+        chunksize = max(1, len(texts) // (n_jobs * 4))
+        worker = partial(_tokenize_in_worker, add_special_tokens=add_special_tokens)
+        return self._pool.map(worker, texts, chunksize=chunksize)
+
+    def close(self):
+
+        """
+        Shuts down the worker processes started by tokenize_parallel, if any.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_jobs = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+
+        """
+        Pickles the tokenizer (e.g. for tokenize_parallel workers) without its worker pool,
+        which can't be pickled, nor its cached tokens, which aren't worth shipping.
+        """
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        state['_pool_jobs'] = None
+        state['_tok_cache'] = {}
+        return state
+
+    def tokenize_stream(self, texts: Iterable[str], chunk_size: int = 64 * 1024) -> Iterator[str]:
+
+        """
+        Lazily tokenizes a text given as an iterable of pieces (e.g. the lines of a file),
+        so that memory stays bounded by chunk_size instead of the size of the whole text.
+
+        Pieces are buffered until chunk_size characters are reached, then the buffer is 
+        cut after its last whitespace: tokens never contain whitespace, so none is split 
+        across two chunks. The remainder is carried over to the next chunk. Note that with
+        NLTK, a period right before a cut is split off as if it ended a sentence.
+
+        Args:
+            texts (Iterable[str]): 
+                The consecutive pieces of the text to tokenize.
+            chunk_size (int, optional): 
+                Number of characters to buffer before tokenizing. Defaults to 64 * 1024.
+        Yields:
+            str: The tokens of the text, in order.
+        """
+
+        buffer = ""
+        for piece in texts:
+            buffer += piece
+            if len(buffer) < chunk_size:
+                continue
+            cut = max(buffer.rfind(space) for space in " \n\t\r\f\v") + 1
+            if cut == 0:
+                # No whitespace to cut at yet, keep buffering
+                continue
+            # Chunks are unlikely to repeat, so bypass the tokenization cache
+            yield from self._tokenize_uncached(buffer[:cut])
+            buffer = buffer[cut:]
+        if buffer:
+            yield from self._tokenize_uncached(buffer)
+
+    def _wrap_with_special_tokens(self, tokens):
+
+        """
+        Inserts, in place, the EOS token at the start and <end_of_text> at the end of 
+        the tokens unless they are already present.
+        """
+        if self.eos_token not in tokens:
+            tokens.insert(0, self.eos_token)
+        if "<end_of_text>" not in tokens:
+            tokens.append("<end_of_text>")
     
     def _convert_token_to_id(self, token):
 
@@ -127,7 +550,8 @@ class NlktTokenizer(PreTrainedTokenizer):
             int: 
                 Token ID, or ID of unknown token if not found.
         """
-        return self.vocab.get(token, self.vocab.get("[UNK]")) + 1 if token in self.vocab else self.vocab.get("[UNK]")
+        token_id = self.vocab.get(token)
+        return token_id + 1 if token_id is not None else self._unk_id
 
     def _convert_id_to_token(self, index: int) -> str:
     
@@ -142,7 +566,81 @@ class NlktTokenizer(PreTrainedTokenizer):
                 Corresponding token, or unknown token if ID not found.
         """
         adjusted_index = index - 1  # Adjust for zero-based indexing
-        return self.id_to_token.get(adjusted_index, "[UNK]")
+        id_to_token = self.id_to_token
+        return id_to_token[adjusted_index] if 0 <= adjusted_index < len(id_to_token) else "[UNK]"
+
+    def encode_ids(self, text) -> List[int]:
+
+        """
+        Tokenizes the text and converts the tokens to their IDs in one go, equivalent to
+        convert_tokens_to_ids(tokenize(text)). With regex_tokenize, the matches of the 
+        token regex are converted directly, skipping the tokenize wrapper and its cache.
+        Otherwise the cached tokens of short texts are read without being copied.
+
+        Args:
+            text (str): 
+                The text to encode.
+        Returns:
+            List[int]: The IDs of the tokens of the text.
+        """
+        if self.regex_tokenize:
+            tokens = self._regex_tokenize(text)
+        elif len(text) > _TOKENIZE_CACHE_MAX_LENGTH:
+            tokens = self._tokenize_uncached(text)
+        else:
+            tokens = self._tokenize_frozen(text)
+        return self.convert_tokens_to_ids(tokens)
+
+    def convert_tokens_to_ids(self, tokens):
+
+        """
+        Converts a token (str) or a sequence of tokens to their IDs. Sequences are converted
+        in a single comprehension over locally bound lookups rather than one
+        _convert_token_to_id call per token.
+
+        Args:
+            tokens (Union[str, List[str]]): 
+                The token(s) to convert.
+        Returns:
+            Union[int, List[int]]: 
+                The token ID(s), using the ID of the unknown token for tokens not found.
+        """
+        if tokens is None or isinstance(tokens, str) or self._unk_id is None:
+            return super().convert_tokens_to_ids(tokens)
+
+        get = self.vocab.get
+        unk_default = self._unk_id - 1  # So that the +1 below gives back the unknown ID
+        added = self.added_tokens_encoder
+        if not added:
+            return [get(token, unk_default) + 1 for token in tokens]
+        return [added[token] if token in added else get(token, unk_default) + 1 for token in tokens]
+
+    def convert_ids_to_tokens(self, ids, skip_special_tokens: bool = False):
+
+        """
+        Converts an ID (int) or a sequence of IDs to their tokens. Sequences are converted 
+        in a single comprehension indexing the id_to_token list directly, with one bounds 
+        check per ID instead of a _convert_id_to_token call.
+
+        Args:
+            ids (Union[int, List[int]]): 
+                The token ID(s) to convert.
+            skip_special_tokens (bool, optional): 
+                Whether to remove special tokens. Defaults to False.
+        Returns:
+            Union[str, List[str]]: 
+                The token(s), using the unknown token for IDs not found.
+        """
+        if isinstance(ids, int) or skip_special_tokens:
+            return super().convert_ids_to_tokens(ids, skip_special_tokens=skip_special_tokens)
+
+        id_to_token = self.id_to_token
+        size = len(id_to_token)  # Valid IDs are 1..size, shifted by one in id_to_token
+        added = self.added_tokens_decoder
+        if not added:
+            return [id_to_token[index - 1] if 0 < index <= size else "[UNK]" for index in map(int, ids)]
+        return [added[index] if index in added else id_to_token[index - 1] if 0 < index <= size else "[UNK]"
+                for index in map(int, ids)]
 
     def vocab_size(self):
     
@@ -168,19 +666,21 @@ class NlktTokenizer(PreTrainedTokenizer):
         if not filename_prefix:
             filename_prefix = ""
         vocab_file = os.path.join(save_directory, filename_prefix + "vocab.txt")
-        with open(vocab_file, 'w', encoding='utf-8') as f:
-            for token in self.vocab.keys():
-                f.write(token + '\n')
+        # One write of the whole vocab, in ID order, through a 1 MiB buffer
+        with open(vocab_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("\n".join(self.id_to_token))
+            f.write("\n")
         return (vocab_file,)
     
     def get_vocab(self) -> Dict[str, int]:
         """
         Returns a dictionary of tokens and their corresponding IDs, adjusted for zero-based indexing.
         """
-        vocab = {self._convert_id_to_token(i + 1): i for i in range(self.vocab_size())}
+        vocab = dict(self.vocab)
 
-        # If the tokenizer has any added tokens, update the vocab dictionary with these
+        # If the tokenizer has any added tokens, update the vocab dictionary with these.
+        # Their IDs in added_tokens_encoder already start after the base vocabulary.
         if hasattr(self, 'added_tokens_encoder'):
-            vocab.update({token: i + len(vocab) for token, i in self.added_tokens_encoder.items()})
+            vocab.update(self.added_tokens_encoder)
 
         return vocab